@@ -20,6 +20,7 @@ get events from event source and dispatch evnets to the subscriber.
 """
 import asyncio
 import functools
+import heapq
 import logging
 import signal
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
@@ -214,15 +215,14 @@ class BackTrackDispatcher(LiveTrackDispatcher):
             return self._now
 
     async def sleep(self, delay: float) -> None:
-        self.sleep_queue.append(delay)
-        self.sleep_queue.sort()
+        heapq.heappush(self.sleep_queue, delay)
         while True:
             while len(self.all_tasks()) > 2:
                 logger.debug("all_tasks:%s", self.all_tasks())
                 await asyncio.sleep(0.1)
 
             try:
-                elasped = self.sleep_queue.pop(0)
+                elasped = heapq.heappop(self.sleep_queue)
             except IndexError:
                 return
             logger.info("elasped:%s delay:%s", elasped, delay)
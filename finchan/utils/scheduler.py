@@ -25,12 +25,30 @@ usage::
 """
 import logging
 import random
+from datetime import datetime, timedelta
 
 from dateutil.parser import parse as parse_dt
-from dateutil.relativedelta import relativedelta as timedelta
+from dateutil.relativedelta import relativedelta
 
 logger = logging.getLogger(__name__)
 
+# units with a fixed length, stepped with the much cheaper `datetime.timedelta`,
+# only months/years need `relativedelta` calendar arithmetic
+_UNIT_SECONDS = {"seconds": 1, "minutes": 60, "hours": 3600, "days": 86400, "weeks": 604800}
+
+_rand = random.random
+
+_EPOCH_DT = datetime(1970, 1, 1, 0, 0, 0)
+
+# fields of the bench datetime replayed onto the first run, per unit
+_UNIT_REPLAY = {
+    "minutes": ("second",),
+    "hours": ("minute", "second"),
+    "days": ("hour", "minute", "second"),
+    "months": ("day", "hour", "minute", "second"),
+    "years": ("month", "day", "hour", "minute", "second"),
+}
+
 
 class TimeScheduler(object):
     """
@@ -55,6 +73,18 @@ class TimeScheduler(object):
         * years
     """
 
+    __slots__ = (
+        "env",
+        "unit",
+        "run_dt",
+        "next_run_dt",
+        "min_step",
+        "max_step",
+        "bench_dt",
+        "_delta_factory",
+        "_step_fixed",
+    )
+
     unit_types = ["once", "seconds", "minutes", "hours", "days", "weeks", "months", "years"]
 
     def __init__(self, env):
@@ -64,7 +94,9 @@ class TimeScheduler(object):
         self.run_dt = None
         self.next_run_dt = None
         self.min_step = self.max_step = 1
-        self.bench_dt = parse_dt("1970-01-01 00:00:00")
+        self._step_fixed = True
+        self._delta_factory = None
+        self.bench_dt = _EPOCH_DT
 
     def bench(self, time_str: str):
         self.bench_dt = parse_dt(time_str)
@@ -76,7 +108,8 @@ class TimeScheduler(object):
         :param step: A quantity of a certain time unit
         :return: An unconfigured :class:`Scheduler <Scheduler>`
         """
-        self.min_step = step
+        self.min_step = self.max_step = step
+        self._step_fixed = True
         return self
 
     def to(self, step: int):
@@ -94,6 +127,7 @@ class TimeScheduler(object):
         """
         self.max_step = step
         assert self.max_step >= self.min_step
+        self._step_fixed = self.min_step == self.max_step
         return self
 
     def seconds(self):
@@ -153,57 +187,45 @@ class TimeScheduler(object):
         return self
 
     def init(self):
-        assert self.unit in Scheduler.unit_types
-        replay_dict = {}
-        if self.bench_dt.year < self.env.now.year:
-            replay_dict["year"] = self.env.now.year
-
-        if self.unit == "minutes":
-            replay_dict["second"] = self.bench_dt.second
-        if self.unit == "hours":
-            replay_dict["minute"] = self.bench_dt.minute
-            replay_dict["second"] = self.bench_dt.second
-        if self.unit == "days":
-            replay_dict["hour"] = self.bench_dt.hour
-            replay_dict["minute"] = self.bench_dt.minute
-            replay_dict["second"] = self.bench_dt.second
-        if self.unit == "months":
-            replay_dict["day"] = self.bench_dt.day
-            replay_dict["hour"] = self.bench_dt.hour
-            replay_dict["minute"] = self.bench_dt.minute
-            replay_dict["second"] = self.bench_dt.second
-        if self.unit == "years":
-            replay_dict["month"] = self.bench_dt.month
-            replay_dict["day"] = self.bench_dt.day
-            replay_dict["hour"] = self.bench_dt.hour
-            replay_dict["minute"] = self.bench_dt.minute
-            replay_dict["second"] = self.bench_dt.second
-
-        self.run_dt = self.next_run_dt = self.env.now.replace(**replay_dict)
-        while self.next_run_dt < self.env.now:
-            if self.max_step is not None:
-                step = random.randint(self.min_step, self.max_step)
-            else:
-                step = self.min_step
-            self.run_dt = self.next_run_dt
-            self.next_run_dt = self.run_dt + timedelta(**{self.unit: step})
+        assert self.unit in TimeScheduler.unit_types
+        self._delta_factory = self._resolve_delta_factory()
+        now = self.env.now
+        replay_dict = {field: getattr(self.bench_dt, field) for field in _UNIT_REPLAY.get(self.unit, ())}
+        if self.bench_dt.year < now.year:
+            replay_dict["year"] = now.year
+
+        self.run_dt = self.next_run_dt = now.replace(**replay_dict)
+        while self.next_run_dt < now:
+            self._schedule_next_run()
             logger.debug("#Scheduler last run:%s next run:%s", self.run_dt, self.next_run_dt)
         return self
 
+    def _resolve_delta_factory(self):
+        if self.unit in _UNIT_SECONDS:
+            unit_seconds = _UNIT_SECONDS[self.unit]
+            return lambda step: timedelta(seconds=unit_seconds * step)
+        unit = self.unit
+        return lambda step: relativedelta(**{unit: step})
+
+    def _schedule_next_run(self):
+        if self._step_fixed:
+            step = self.min_step
+        else:
+            step = self.min_step + int(_rand() * (self.max_step - self.min_step + 1))
+        self.run_dt = self.next_run_dt
+        self.next_run_dt = self.run_dt + self._delta_factory(step)
+
     def __aiter__(self):
         self.init()
         return self
 
     async def __anext__(self):
-        sleep_seconds = (self.next_run_dt - self.env.now).total_seconds()
-        logger.debug("#Scheduler anext, now:%s next_run_dt:%s", self.env.now, self.next_run_dt)
+        # never hand a negative delay to the dispatcher, backtrack sleep would move time backwards
+        now = self.env.now
+        sleep_seconds = max(0, (self.next_run_dt - now).total_seconds())
+        logger.debug("#Scheduler anext, now:%s next_run_dt:%s", now, self.next_run_dt)
         await self.env.dispatcher.sleep(sleep_seconds)
-        if self.max_step is not None:
-            step = random.randint(self.min_step, self.max_step)
-        else:
-            step = self.min_step
-        self.run_dt = self.next_run_dt
-        self.next_run_dt = self.run_dt + timedelta(**{self.unit: step})
+        self._schedule_next_run()
         return self.run_dt
 
     async def __wait__(self):
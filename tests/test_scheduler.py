@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_scheduler
+----------------------------------
+
+Tests for `finchan.utils.scheduler` module.
+"""
+
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from finchan.utils.scheduler import TimeScheduler
+
+
+class StubDispatcher(object):
+    async def sleep(self, delay):
+        pass
+
+
+class StubEnv(object):
+    def __init__(self, now):
+        self.now = now
+        self.dispatcher = StubDispatcher()
+
+
+async def collect_runs(scheduler, count):
+    runs = []
+    async for dt in scheduler:
+        runs.append(dt)
+        if len(runs) == count:
+            break
+    return runs
+
+
+class TestSteps(unittest.TestCase):
+    def test_every_fixed_step(self):
+        now = datetime(2020, 5, 6, 7, 8, 9)
+        runs = asyncio.run(collect_runs(TimeScheduler(StubEnv(now)).every(3).seconds(), 5))
+        self.assertEqual(runs, [now + timedelta(seconds=3 * i) for i in range(5)])
+
+    def test_every_to_step_range(self):
+        now = datetime(2020, 5, 6, 7, 8, 9)
+        runs = asyncio.run(collect_runs(TimeScheduler(StubEnv(now)).every(3).to(8).seconds(), 500))
+        steps = {int((b - a).total_seconds()) for a, b in zip(runs, runs[1:])}
+        self.assertEqual(steps, set(range(3, 9)))
+
+    def test_first_run_replays_bench(self):
+        now = datetime(2020, 5, 6, 7, 8, 9)
+        cases = [
+            ("minutes", "2019-02-03 04:05:06", datetime(2020, 5, 6, 7, 8, 6), datetime(2020, 5, 6, 7, 9, 6)),
+            ("days", "2019-02-03 04:05:06", datetime(2020, 5, 6, 4, 5, 6), datetime(2020, 5, 7, 4, 5, 6)),
+            ("days", "2019-02-03 09:00:00", datetime(2020, 5, 6, 9, 0, 0), datetime(2020, 5, 6, 9, 0, 0)),
+            ("months", "2019-02-03 04:05:06", datetime(2020, 5, 3, 4, 5, 6), datetime(2020, 6, 3, 4, 5, 6)),
+        ]
+        for unit, bench, run_dt, next_run_dt in cases:
+            with self.subTest(unit=unit, bench=bench):
+                scheduler = getattr(TimeScheduler(StubEnv(now)).every(1), unit)()
+                scheduler.bench(bench)
+                scheduler.init()
+                self.assertEqual((scheduler.run_dt, scheduler.next_run_dt), (run_dt, next_run_dt))